@@ -0,0 +1,22 @@
+"""
+web3/eth-account version shims shared by the relayers and posters.
+"""
+
+
+def _probe():
+    # eth-account >= 0.13 (web3 v7) names the signed bytes .raw_transaction,
+    # older releases .rawTransaction; sign one throwaway tx to find out which
+    from eth_account import Account
+    a = Account.create()
+    s = Account.sign_transaction({
+        "to": a.address, "value": 0, "gas": 21000, "gasPrice": 1, "nonce": 0, "chainId": 1,
+    }, a.key)
+    return "raw_transaction" if hasattr(s, "raw_transaction") else "rawTransaction"
+
+
+RAW_ATTR = _probe()
+
+
+def raw_tx(signed):
+    """Raw signed transaction bytes, ready for send_raw_transaction."""
+    return getattr(signed, RAW_ATTR)
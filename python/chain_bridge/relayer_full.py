@@ -5,46 +5,306 @@ TAPFed relayer_full.py
 - then fetches CipherStore.getCiphers(round) on Chain A and posts missing
   postCipher(round, cid, root) -> Chain B
 - idempotent: checks existing cids on Chain B and skips duplicates
-- robust for web3 v7+ and older (raw_transaction vs rawTransaction)
+- optional wallet pool (PRIVATE_KEYS=k1,k2,...) posts ciphers concurrently
+- optional RPC_A_WS: wakes on RoundRegistered logs instead of polling lastRound()
+- robust for web3 v7+ and older (raw_transaction vs rawTransaction, see _compat)
 """
 
-import os, json, time
-from web3 import Web3
+import os, sys, time, asyncio, threading
+import requests
+from eth_account import Account
+from eth_abi import decode as abi_decode
+from web3 import Web3, AsyncWeb3, AsyncHTTPProvider
+from web3.datastructures import AttributeDict
+from web3.exceptions import Web3Exception
+from hexbytes import HexBytes
+try:
+    from web3 import WebSocketProvider  # web3 v7+
+except ImportError:
+    WebSocketProvider = None
 
-def load_abi(path):
-    with open(path, "r", encoding="utf-8") as f:
-        art = json.load(f)
-        return art.get("abi", art)
+# repo/python on sys.path so shared helpers import when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.abi_loader import load_abi
+from utils.http_session import make_provider
+from utils.fees import fees, async_fees
+from chain_bridge._compat import raw_tx
+from chain_bridge.relayer_state import load_state, save_state, resume_round
+
+def make_async_w3(rpc):
+    return AsyncWeb3(AsyncHTTPProvider(rpc, request_kwargs={"timeout": 30}))
 
 def to_checksum(addr):
     # wrap robustly
     return Web3.to_checksum_address(addr)
 
-def get_cids_from_cipherstore(contract, round_id):
+# canonical Multicall3 deployment (same address on most EVM chains)
+MULTICALL3_ADDR = os.getenv("MULTICALL3_ADDR", "0xcA11bde05977b3631167028862bE2a173976CA11")
+MULTICALL3_ABI = [{
+    "name": "aggregate3", "type": "function", "stateMutability": "payable",
+    "inputs": [{"name": "calls", "type": "tuple[]", "components": [
+        {"name": "target", "type": "address"},
+        {"name": "allowFailure", "type": "bool"},
+        {"name": "callData", "type": "bytes"},
+    ]}],
+    "outputs": [{"name": "returnData", "type": "tuple[]", "components": [
+        {"name": "success", "type": "bool"},
+        {"name": "returnData", "type": "bytes"},
+    ]}],
+}]
+
+def make_multicall(w3):
+    # None when Multicall3 isn't deployed (e.g. a fresh anvil/hardhat node)
+    addr = to_checksum(MULTICALL3_ADDR)
+    try:
+        if not w3.eth.get_code(addr):
+            return None
+    except Exception:
+        return None
+    return w3.eth.contract(address=addr, abi=MULTICALL3_ABI)
+
+def _abi_type(param):
+    t = param["type"]
+    if t.startswith("tuple"):
+        return "(" + ",".join(_abi_type(c) for c in param["components"]) + ")" + t[len("tuple"):]
+    return t
+
+def _normalize(param, value):
+    # match what fn.call() returns: checksummed addresses, lists for arrays
+    t = param["type"]
+    if t.endswith("]"):
+        item = dict(param, type=t[:t.rindex("[")])
+        return [_normalize(item, v) for v in value]
+    if t == "tuple":
+        return tuple(_normalize(c, v) for c, v in zip(param["components"], value))
+    if t == "address":
+        return to_checksum(value)
+    return value
+
+def multicall_read(multicall, calls):
+    # all calls execute in a single eth_call; results normalized like fn.call()
+    payload = [(c.address, False, c._encode_transaction_data()) for c in calls]
+    results = multicall.functions.aggregate3(payload).call()
+    out = []
+    for c, (ok, data) in zip(calls, results):
+        outputs = c.abi["outputs"]
+        vals = abi_decode([_abi_type(o) for o in outputs], data)
+        vals = [_normalize(o, v) for o, v in zip(outputs, vals)]
+        out.append(vals[0] if len(vals) == 1 else vals)
+    return out
+
+def batch_call(w3, calls, multicall=None):
+    # read-only contract calls in one round-trip: Multicall3 if deployed, else a
+    # JSON-RPC batch on this provider, else one call each
+    if multicall is not None:
+        try:
+            return multicall_read(multicall, calls)
+        except Exception:
+            pass
+    try:
+        with w3.batch_requests() as batch:
+            for c in calls:
+                batch.add(c)
+            return list(batch.execute())
+    except Exception:
+        return [c.call() for c in calls]
+
+# fee fields come from utils.fees (EIP-1559, cached); chain id never changes,
+# so it is read once per web3 instance (keyed like the fee cache)
+_chain_id_cache = {}
+
+def cached_chain_id(w3):
+    key = id(w3)
+    if key not in _chain_id_cache:
+        _chain_id_cache[key] = w3.eth.chain_id
+    return _chain_id_cache[key]
+
+# eth_sendRawTransactionSync (Flashblocks/RISE/MegaETH-style endpoints) returns the
+# receipt in the same round-trip; probed once by detect_sync_send()
+METHOD_NOT_FOUND = -32601
+SYNC_SEND_TIMEOUT = 4
+_sync_send_supported = False
+
+def detect_sync_send(w3):
+    global _sync_send_supported
     try:
-        arr = contract.functions.getCiphers(round_id).call()
+        resp = w3.provider.make_request("eth_sendRawTransactionSync", ["0x"])
     except Exception:
-        return []
-    # each entry is (poster, roundId, cid, root, timestamp)
-    return [entry[2] for entry in arr]
+        _sync_send_supported = False
+        return False
+    err = resp.get("error") or {}
+    msg = str(err.get("message", "")).lower()
+    # any error other than "unknown method" (e.g. invalid params) means it exists
+    _sync_send_supported = bool(err) and err.get("code") != METHOD_NOT_FOUND \
+        and "not found" not in msg and "not supported" not in msg and "does not exist" not in msg
+    return _sync_send_supported
 
-def post_cipher_if_missing(w3B, csB, private_key, round_id, cid, root, existing_set):
+def send_sync_or_fallback(w3, raw, wait=True, poll_latency=0.2):
+    """
+    Submit a signed tx, returning (tx_hash_hex, receipt or None).
+    Uses eth_sendRawTransactionSync when detect_sync_send() found it; otherwise
+    send_raw_transaction, plus wait_for_transaction_receipt when wait=True.
+    """
+    if _sync_send_supported:
+        resp = w3.provider.make_request("eth_sendRawTransactionSync", [Web3.to_hex(raw)])
+        res = resp.get("result")
+        if res:
+            rec = AttributeDict({
+                "transactionHash": res["transactionHash"],
+                "blockNumber": int(res["blockNumber"], 16),
+                "status": int(res.get("status", "0x1"), 16),
+            })
+            return res["transactionHash"], rec
+        err = resp.get("error") or {}
+        if err.get("code") == SYNC_SEND_TIMEOUT:
+            # accepted but not included within the node's timeout; poll for it
+            txh = Web3.to_hex(Web3.keccak(raw))
+            return txh, w3.eth.wait_for_transaction_receipt(txh, poll_latency=poll_latency)
+        if err.get("code") != METHOD_NOT_FOUND:
+            raise ValueError(err)
+    txh = w3.eth.send_raw_transaction(raw)
+    rec = w3.eth.wait_for_transaction_receipt(txh, poll_latency=poll_latency) if wait else None
+    return Web3.to_hex(txh), rec
+
+def post_cipher_if_missing(w3B, csB, acct, nonce, round_id, cid, root, existing_set):
+    # acct is a LocalAccount built once by the caller (key parsed/derived once)
+    # nonce is tracked by the caller and must be bumped after a "posted"/"submitted"
+    # result. "submitted" means the caller still has to wait for the receipt, so
+    # several posts can share a block; "posted" means it is already mined
     if cid in existing_set:
         return None, "skip"
-    sender = w3B.eth.account.from_key(private_key).address
     tx = csB.functions.postCipher(round_id, cid, root).build_transaction({
-        "from": sender,
-        "nonce": w3B.eth.get_transaction_count(sender),
+        "from": acct.address,
+        "nonce": nonce,
         "gas": 500000,
-        "gasPrice": w3B.eth.gas_price,
+        "chainId": cached_chain_id(w3B),
+        **fees(w3B),
     })
-    signed = w3B.eth.account.sign_transaction(tx, private_key)
-    raw = getattr(signed, "raw_transaction", None) or getattr(signed, "rawTransaction", None)
-    if raw is None:
-        raise RuntimeError("SignedTransaction missing raw tx")
-    txh = w3B.eth.send_raw_transaction(raw)
-    rec = w3B.eth.wait_for_transaction_receipt(txh)
-    return txh.hex(), "posted"
+    signed = acct.sign_transaction(tx)
+    txh, rec = send_sync_or_fallback(w3B, raw_tx(signed), wait=False)
+    return txh, "posted" if rec is not None else "submitted"
+
+# DKGRegistry storage layout: slot 0 = rounds mapping, slot 1 = lastRound
+LAST_ROUND_SLOT = 1
+
+def read_last_round(w3, addr):
+    # eth_getStorageAt: no EVM call / ABI decode on either side
+    return int.from_bytes(w3.eth.get_storage_at(addr, LAST_ROUND_SLOT), "big")
+
+ROUND_REGISTERED_TOPIC = Web3.to_hex(Web3.keccak(text="RoundRegistered(uint256,address,bytes32,string)"))
+
+LOG_SCAN_MAX_STEP = 10_000
+
+def scan_logs(contract, from_block, to_block, step=500, topics=None):
+    """
+    eth_getLogs for contract.address over [from_block, to_block] in windows of
+    `step` blocks. A window that errors or times out is retried at half the
+    size; each success grows the window 1.25x, up to LOG_SCAN_MAX_STEP.
+    """
+    w3 = contract.w3
+    logs = []
+    start = from_block
+    while start <= to_block:
+        end = min(start + step - 1, to_block)
+        params = {"address": contract.address, "fromBlock": start, "toBlock": end}
+        if topics:
+            params["topics"] = topics
+        try:
+            logs.extend(w3.eth.get_logs(params))
+        except (ValueError, Web3Exception, requests.exceptions.Timeout):
+            if step == 1:
+                raise
+            step = max(1, step // 2)
+            continue
+        start = end + 1
+        step = min(max(step + 1, int(step * 1.25)), LOG_SCAN_MAX_STEP)
+    return logs
+
+def round_of(log):
+    # RoundRegistered topics[1] is the indexed roundId
+    return int.from_bytes(HexBytes(log["topics"][1]), "big")
+
+async def _watch_rounds_ws(ws_url, dkg_addr, on_round):
+    async with AsyncWeb3(WebSocketProvider(ws_url)) as w3ws:
+        await w3ws.eth.subscribe("logs", {"address": dkg_addr, "topics": [ROUND_REGISTERED_TOPIC]})
+        print("Subscribed to RoundRegistered on Chain A via", ws_url)
+        async for msg in w3ws.socket.process_subscriptions():
+            on_round(round_of(msg["result"]))
+
+def start_round_watcher(ws_url, dkg_addr, wake, seen):
+    """
+    Background thread: eth_subscribe to RoundRegistered logs on Chain A, record
+    the highest round id in seen["round"] and set `wake` for each one.
+    Reconnects after drops and wakes the main loop so one HTTP read catches
+    anything missed while disconnected.
+    """
+    def on_round(r):
+        print("RoundRegistered on Chain A:", r)
+        seen["round"] = max(seen["round"], r)
+        wake.set()
+
+    def run():
+        while True:
+            try:
+                asyncio.run(_watch_rounds_ws(ws_url, dkg_addr, on_round))
+            except Exception as e:
+                print("WebSocket watcher error:", e)
+            wake.set()
+            time.sleep(5)
+
+    t = threading.Thread(target=run, name="round-watcher", daemon=True)
+    t.start()
+    return t
+
+async def post_ciphers_concurrently(w3B_async, csB_async, accts, round_id, entries):
+    """
+    Post (cid, root) entries to Chain B spread round-robin over a wallet pool.
+    Each account posts its share in nonce order while all accounts run at once,
+    so the per-tx inclusion wait overlaps across len(accts) wallets.
+    Returns [(cid, tx_hash_hex or exception), ...] in input order.
+    """
+    nonces = await asyncio.gather(*[
+        w3B_async.eth.get_transaction_count(a.address, "pending") for a in accts
+    ])
+    fee_fields = await async_fees(w3B_async)
+    chain_id = await w3B_async.eth.chain_id
+    post_fn = csB_async.functions.postCipher
+
+    async def send_one(acct, nonce, cid, root):
+        tx = await post_fn(round_id, cid, root).build_transaction({
+            "from": acct.address,
+            "nonce": nonce,
+            "gas": 500000,
+            "chainId": chain_id,
+            **fee_fields,
+        })
+        signed = acct.sign_transaction(tx)
+        return await w3B_async.eth.send_raw_transaction(raw_tx(signed))
+
+    results = [None] * len(entries)
+
+    # one worker per account keeps that account's nonces strictly ordered
+    async def worker(k):
+        nonce = nonces[k]
+        for i in range(k, len(entries), len(accts)):
+            cid, root = entries[i]
+            try:
+                txh = await send_one(accts[k], nonce, cid, root)
+            except Exception as e:
+                # nothing was broadcast, so the nonce is still free
+                results[i] = (cid, e)
+                continue
+            # the nonce is consumed once the node accepted the tx, even if
+            # waiting for its receipt fails below
+            nonce += 1
+            try:
+                await w3B_async.eth.wait_for_transaction_receipt(txh)
+                results[i] = (cid, txh.hex())
+            except Exception as e:
+                results[i] = (cid, e)
+
+    await asyncio.gather(*[worker(k) for k in range(len(accts))])
+    return results
 
 def main():
     print("\n=== TAPFed full relayer (DKGRegistry + CipherStore) ===\n")
@@ -58,16 +318,22 @@ def main():
     CIPHER_A = os.getenv("CIPHER_A_ADDR")
     CIPHER_B = os.getenv("CIPHER_B_ADDR")
 
+    RPC_A_WS = os.getenv("RPC_A_WS")
+
     PRIVATE_KEY = os.getenv("PRIVATE_KEY")
+    PRIVATE_KEYS = [k.strip() for k in os.getenv("PRIVATE_KEYS", "").split(",") if k.strip()]
+    if not PRIVATE_KEY and PRIVATE_KEYS:
+        PRIVATE_KEY = PRIVATE_KEYS[0]
     if not PRIVATE_KEY:
         print("ERROR: set env PRIVATE_KEY to a Chain B private key (for signing).")
         return
 
-    w3A = Web3(Web3.HTTPProvider(RPC_A))
-    w3B = Web3(Web3.HTTPProvider(RPC_B))
+    w3A = Web3(make_provider(RPC_A))
+    w3B = Web3(make_provider(RPC_B))
 
     print("Chain A connected?", w3A.is_connected())
     print("Chain B connected?", w3B.is_connected())
+    print("Chain B eth_sendRawTransactionSync?", detect_sync_send(w3B))
 
     abi_dkg = load_abi("python/abi/DKGRegistry.json")
     abi_cipher = load_abi("python/abi/CipherStore.json")
@@ -83,25 +349,100 @@ def main():
     csA = w3A.eth.contract(address=csA_addr, abi=abi_cipher)
     csB = w3B.eth.contract(address=csB_addr, abi=abi_cipher)
 
+    mcA = make_multicall(w3A)
+    mcB = make_multicall(w3B)
+    print("Multicall3 on A/B?", mcA is not None, mcB is not None)
+
+    # wallet pool for concurrent cipher posting (only used with 2+ keys)
+    accts = [Account.from_key(k) for k in PRIVATE_KEYS]
+    if len(accts) > 1:
+        w3B_async = make_async_w3(RPC_B)
+        csB_async = w3B_async.eth.contract(address=csB_addr, abi=abi_cipher)
+        print("Wallet pool:", [a.address for a in accts])
+
     try:
-        last_seen = dkgB.functions.lastRound().call()
+        chain_last = read_last_round(w3B, addrB)
     except Exception:
-        last_seen = 0
-    print("Last round already on Chain B:", last_seen)
+        chain_last = 0
+    print("Last round already on Chain B:", chain_last)
 
-    sender = w3B.eth.account.from_key(PRIVATE_KEY).address
+    # last_seen is persisted so a restart resumes where this relayer left off
+    state = load_state(identity=[cached_chain_id(w3B), addrB, csB_addr])
+    last_seen = resume_round(state, chain_last, dkgB)
+    print("Resuming from round", last_seen)
+
+    # rounds registered on A while the relayer was away are found by scanning
+    # RoundRegistered logs into `backlog`. Rounds Chain B registered after the
+    # resume point may still lack ciphers (a crash between registerRound and the
+    # last postCipher), so they are queued for a getCiphers re-check up front
+    backlog = set()
+    if last_seen < chain_last:
+        recheck = list(range(last_seen + 1, chain_last + 1))
+        infos = batch_call(w3B, [dkgB.functions.getRoundInfo(r) for r in recheck], mcB)
+        backlog.update(r for r, info_b in zip(recheck, infos) if info_b[4] != 0)
+        print("Re-checking ciphers on Chain B for rounds:", sorted(backlog))
+
+    acct = Account.from_key(PRIVATE_KEY)
+    sender = acct.address
     print("Relayer sender:", sender)
 
+    # nonce is tracked locally from here on; re-synced from the node after errors.
+    # "pending" counts txs still in the mempool, so their nonces aren't reused
+    nonce = w3B.eth.get_transaction_count(sender, "pending")
+
     poll = int(os.getenv("RELAYER_POLL", "5"))
     backoff = int(os.getenv("RELAYER_ERROR_BACKOFF", "10"))
+    receipt_poll = float(os.getenv("RELAYER_RECEIPT_POLL", "0.2"))
+
+    # with RPC_A_WS the loop sleeps until a RoundRegistered log arrives; the HTTP
+    # read still runs every RELAYER_WS_IDLE_POLL seconds as a safety net. If the
+    # HTTP node lags the WS node, lastRound is re-read every RELAYER_WS_LAG_POLL
+    # seconds (for up to RELAYER_WS_LAG_MAX) until it reaches the logged round
+    wake = threading.Event()
+    ws_seen = {"round": 0}
+    watcher = None
+    if RPC_A_WS and WebSocketProvider is None:
+        print("RPC_A_WS set but this web3 has no WebSocketProvider; polling over HTTP")
+    elif RPC_A_WS:
+        watcher = start_round_watcher(RPC_A_WS, addrA, wake, ws_seen)
+    ws_idle_poll = int(os.getenv("RELAYER_WS_IDLE_POLL", "300"))
+    ws_lag_poll = float(os.getenv("RELAYER_WS_LAG_POLL", "1"))
+    ws_lag_max = float(os.getenv("RELAYER_WS_LAG_MAX", "60"))
+    lag_until = None
+
+    # scan_from only moves forward so nothing is re-scanned
+    scan_from = int(os.getenv("RELAYER_FROM_BLOCK", "0"))
+    behind = False
 
     while True:
         try:
-            rA = dkgA.functions.lastRound().call()
+            # an idle poll is a single eth_getStorageAt; the round's info and
+            # ciphers are fetched together only once there is a new round
+            rA = read_last_round(w3A, addrA)
+            latest = rA
+            if rA > last_seen + 1:
+                try:
+                    head = w3A.eth.block_number
+                    if scan_from <= head:
+                        logs = scan_logs(dkgA, scan_from, head, topics=[ROUND_REGISTERED_TOPIC])
+                        backlog.update(round_of(log) for log in logs)
+                        scan_from = head + 1
+                except Exception as e:
+                    # e.g. pruned log history or a provider range cap: still mirror
+                    # the latest round; scan_from is kept so the next loop retries
+                    print("  log scan for skipped rounds failed:", e)
+                backlog = set(r for r in backlog if r > last_seen)
+                skipped = sorted(r for r in backlog if r < rA)
+                if skipped:
+                    print("  backfilling skipped rounds:", skipped)
+                    rA = skipped[0]
             if rA > last_seen:
                 print(f"\\n>>> New round on Chain A: {rA}")
 
-                info = dkgA.functions.getRoundInfo(rA).call()
+                info, ciphers = batch_call(w3A, [
+                    dkgA.functions.getRoundInfo(rA),
+                    csA.functions.getCiphers(rA),
+                ], mcA)
                 root = info[2]
                 cid = info[3]
                 try:
@@ -111,54 +452,124 @@ def main():
                 print("  root:", root_hex)
                 print("  cid :", cid)
 
+                # what Chain B already has for this round (e.g. after a partial mirror);
+                # both reads share one round-trip, so they are always taken fresh
+                info_b, ciphers_b = batch_call(w3B, [
+                    dkgB.functions.getRoundInfo(rA),
+                    csB.functions.getCiphers(rA),
+                ], mcB)
+                # each entry is (poster, roundId, cid, root, timestamp)
+                existing_set = set(entry[2] for entry in ciphers_b)
+
                 # 1) mirror registry entry to Chain B
-                tx = dkgB.functions.registerRound(rA, root, cid).build_transaction({
-                    "from": sender,
-                    "nonce": w3B.eth.get_transaction_count(sender),
-                    "gas": 800000,
-                    "gasPrice": w3B.eth.gas_price,
-                })
-                signed = w3B.eth.account.sign_transaction(tx, PRIVATE_KEY)
-                raw = getattr(signed, "raw_transaction", None) or getattr(signed, "rawTransaction", None)
-                if raw is None:
-                    raise RuntimeError("SignedTransaction missing raw tx")
-                txh = w3B.eth.send_raw_transaction(raw)
-                print("  submitted registerRound tx:", txh.hex())
-                rec = w3B.eth.wait_for_transaction_receipt(txh)
-                print("  registerRound mined in block", rec.blockNumber)
-
-                # 2) mirror CipherStore entries (fetch from Chain A)
-                ciphers = csA.functions.getCiphers(rA).call()
-                print("  found", len(ciphers), "ciphers on Chain A for round", rA)
+                if info_b[4] != 0:
+                    print("  registerRound already on Chain B, skipping")
+                else:
+                    tx = dkgB.functions.registerRound(rA, root, cid).build_transaction({
+                        "from": sender,
+                        "nonce": nonce,
+                        "gas": 800000,
+                        "chainId": cached_chain_id(w3B),
+                        **fees(w3B),
+                    })
+                    signed = acct.sign_transaction(tx)
+                    txh, rec = send_sync_or_fallback(w3B, raw_tx(signed), poll_latency=receipt_poll)
+                    nonce += 1
+                    print("  registerRound tx:", txh)
+                    print("  registerRound mined in block", rec.blockNumber)
 
-                existing = get_cids_from_cipherstore(csB, rA)
-                existing_set = set(existing)
+                # 2) mirror CipherStore entries (read from Chain A above)
+                print("  found", len(ciphers), "ciphers on Chain A for round", rA)
                 print("  already on Chain B:", len(existing_set))
 
-                for idx, entry in enumerate(ciphers):
-                    poster, rr, cid_e, root_e, ts = entry
-                    if cid_e in existing_set:
-                        print(f"   [{idx}] skip (already on B):", cid_e)
-                        continue
-                    print(f"   [{idx}] posting cid ->", cid_e)
-                    txh2, status = post_cipher_if_missing(w3B, csB, PRIVATE_KEY, rA, cid_e, root_e, existing_set)
-                    if status == "posted":
-                        print("     posted tx:", txh2)
-                        # add to existing_set to avoid posting duplicates in same loop
-                        existing_set.add(cid_e)
-                    else:
-                        print("     skipped:", cid_e)
+                if len(accts) > 1:
+                    todo, queued = [], set()
+                    for idx, entry in enumerate(ciphers):
+                        poster, rr, cid_e, root_e, ts = entry
+                        if cid_e in existing_set:
+                            print(f"   [{idx}] skip (already on B):", cid_e)
+                        elif cid_e not in queued:
+                            queued.add(cid_e)
+                            todo.append((cid_e, root_e))
+                    print("  posting", len(todo), "ciphers via", len(accts), "wallets")
+                    results = asyncio.run(post_ciphers_concurrently(w3B_async, csB_async, accts, rA, todo))
+                    failed = 0
+                    for cid_e, res in results:
+                        if isinstance(res, Exception):
+                            failed += 1
+                            print("     failed:", cid_e, "->", res)
+                        else:
+                            print("     posted tx:", res, "cid:", cid_e)
+                            existing_set.add(cid_e)
+                    # the pool may include the relayer sender itself
+                    nonce = w3B.eth.get_transaction_count(sender, "pending")
+                    if failed:
+                        raise RuntimeError(f"{failed} cipher post(s) failed for round {rA}")
+                else:
+                    # phase 1: submit every missing cipher with consecutive nonces
+                    pending = []
+                    send_error = None
+                    for idx, entry in enumerate(ciphers):
+                        poster, rr, cid_e, root_e, ts = entry
+                        if cid_e in existing_set:
+                            print(f"   [{idx}] skip (already on B):", cid_e)
+                            continue
+                        print(f"   [{idx}] posting cid ->", cid_e)
+                        try:
+                            txh2, status = post_cipher_if_missing(w3B, csB, acct, nonce, rA, cid_e, root_e, existing_set)
+                        except Exception as e:
+                            send_error = e
+                            break
+                        if status in ("posted", "submitted"):
+                            nonce += 1
+                            print("     " + status + " tx:", txh2)
+                            # add to existing_set to avoid posting duplicates in same loop
+                            existing_set.add(cid_e)
+                            if status == "submitted":
+                                pending.append(txh2)
+                        else:
+                            print("     skipped:", cid_e)
+
+                    # phase 2: wait on receipts together (usually one block for all);
+                    # txs already submitted are awaited even if a later send failed
+                    for txh2 in pending:
+                        rec2 = w3B.eth.wait_for_transaction_receipt(txh2, poll_latency=receipt_poll)
+                        print("     mined", txh2, "in block", rec2.blockNumber)
+                    if send_error is not None:
+                        raise send_error
 
                 # 3) update last_seen after successful mirror
                 last_seen = rA
+                state["last_seen"] = last_seen
+                save_state(state)
                 print("  round", rA, "mirrored successfully.")
+            # still backfilling: go straight to the next round
+            behind = latest > last_seen
 
         except Exception as e:
             print("Error in relayer loop:", e)
+            try:
+                nonce = w3B.eth.get_transaction_count(sender, "pending")
+            except Exception:
+                pass
             time.sleep(backoff)
             continue
 
-        time.sleep(poll)
+        if behind:
+            continue
+        if watcher is not None:
+            if ws_seen["round"] > latest:
+                if lag_until is None:
+                    lag_until = time.time() + ws_lag_max
+                if time.time() < lag_until:
+                    time.sleep(ws_lag_poll)
+                    continue
+                print("Chain A HTTP node still behind round", ws_seen["round"], "seen over WebSocket")
+            lag_until = None
+            wake.wait(ws_idle_poll)
+            wake.clear()
+        else:
+            time.sleep(poll)
 
 if __name__ == "__main__":
     main()
@@ -1,20 +1,22 @@
 ﻿"""
 Fixed TAPFed cross-chain relayer for modern web3:
-- uses signed.raw_transaction (snake_case) to work with web3 v7+
-- updates last_seen only after successful receipt
+- raw tx attribute (raw_transaction vs rawTransaction) resolved once in _compat
+- updates last_seen only after successful receipt (persisted to RELAYER_RUNNER_STATE)
 - backoff on errors to avoid tight repeat loops
 """
 
 import os
-import json
+import sys
 import time
 from web3 import Web3
 
-
-def load_abi(path):
-    with open(path, "r", encoding="utf-8") as f:
-        art = json.load(f)
-        return art.get("abi", art)
+# repo/python on sys.path so shared helpers import when run as a script
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.abi_loader import load_abi
+from utils.http_session import make_provider
+from chain_bridge._compat import raw_tx
+from utils.fees import fees
+from chain_bridge.relayer_state import RUNNER_STATE_PATH, load_state, save_state, resume_round, round_on_chain
 
 
 def main():
@@ -31,8 +33,8 @@ def main():
         print("ERROR: Set $env:PRIVATE_KEY to a Chain B private key.")
         return
 
-    w3A = Web3(Web3.HTTPProvider(RPC_A))
-    w3B = Web3(Web3.HTTPProvider(RPC_B))
+    w3A = Web3(make_provider(RPC_A))
+    w3B = Web3(make_provider(RPC_B))
 
     print("Chain A connected?", w3A.is_connected())
     print("Chain B connected?", w3B.is_connected())
@@ -47,10 +49,14 @@ def main():
     contractB = w3B.eth.contract(address=addrB, abi=abi_dkg)
 
     try:
-        last_seen = contractB.functions.lastRound().call()
+        chain_last = contractB.functions.lastRound().call()
     except Exception:
-        last_seen = 0
-    print("Last round already on Chain B:", last_seen)
+        chain_last = 0
+    print("Last round already on Chain B:", chain_last)
+
+    state = load_state(RUNNER_STATE_PATH, identity=[w3B.eth.chain_id, addrB])
+    last_seen = resume_round(state, chain_last, contractB)
+    print("Resuming from round:", last_seen)
 
     acct = w3B.eth.account.from_key(PRIVATE_KEY)
     sender = acct.address
@@ -78,34 +84,32 @@ def main():
                 print("  mirroring root:", root_hex)
                 print("  mirroring cid:", cid)
 
-                tx = contractB.functions.registerRound(
-                    rA, root, cid
-                ).build_transaction({
-                    "from": sender,
-                    "nonce": w3B.eth.get_transaction_count(sender),
-                    "gas": 800000,
-                    "gasPrice": w3B.eth.gas_price,
-                })
-
-                signed = w3B.eth.account.sign_transaction(tx, PRIVATE_KEY)
-
-                # web3 v7+ SignedTransaction uses .raw_transaction (snake_case)
-                raw = getattr(signed, "raw_transaction", None)
-                if raw is None:
-                    # fallback: try camelCase name (older web3)
-                    raw = getattr(signed, "rawTransaction", None)
+                # resuming below Chain B's lastRound (e.g. a crash after the
+                # receipt but before the state save): don't register twice
+                if round_on_chain(contractB, rA):
+                    print("  round already on Chain B, skipping registerRound")
+                else:
+                    tx = contractB.functions.registerRound(
+                        rA, root, cid
+                    ).build_transaction({
+                        "from": sender,
+                        "nonce": w3B.eth.get_transaction_count(sender),
+                        "gas": 800000,
+                        **fees(w3B),
+                    })
 
-                if raw is None:
-                    raise RuntimeError("SignedTransaction has no raw transaction attribute")
+                    signed = acct.sign_transaction(tx)
 
-                tx_hash = w3B.eth.send_raw_transaction(raw)
-                print("  submitted tx:", tx_hash.hex())
+                    tx_hash = w3B.eth.send_raw_transaction(raw_tx(signed))
+                    print("  submitted tx:", tx_hash.hex())
 
-                receipt = w3B.eth.wait_for_transaction_receipt(tx_hash)
-                print("  mined in block:", receipt.blockNumber)
+                    receipt = w3B.eth.wait_for_transaction_receipt(tx_hash)
+                    print("  mined in block:", receipt.blockNumber)
 
                 # update last_seen only after successful receipt
                 last_seen = rA
+                state["last_seen"] = last_seen
+                save_state(state, RUNNER_STATE_PATH)
 
         except Exception as e:
             print("Error:", e)
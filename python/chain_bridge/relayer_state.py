@@ -0,0 +1,67 @@
+"""
+On-disk relayer state used by relayer_full / relayer_runner (one file each):
+  {"identity": [...], "last_seen": N}
+so a restarted relayer resumes from the last round it fully mirrored.
+identity names the Chain B deployment (chain id + contract addresses); a file
+written for a different deployment is ignored.
+"""
+
+import os, json
+
+STATE_PATH = os.getenv("RELAYER_STATE", "relayer_state.json")
+RUNNER_STATE_PATH = os.getenv("RELAYER_RUNNER_STATE", "relayer_runner_state.json")
+
+def load_state(path=STATE_PATH, identity=None):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        data = {}
+    if not isinstance(data, dict):
+        data = {}
+    if identity is not None:
+        identity = list(identity)
+        if data.get("identity") != identity:
+            if data:
+                print("Ignoring relayer state in", path, "(written for another deployment)")
+            data = {}
+    return {
+        "identity": identity if identity is not None else data.get("identity"),
+        "last_seen": int(data.get("last_seen", 0)),
+        # False when there was no usable file (missing, corrupt, other deployment)
+        "restored": "last_seen" in data,
+    }
+
+def save_state(state, path=STATE_PATH):
+    data = {
+        "identity": state.get("identity"),
+        "last_seen": state["last_seen"],
+    }
+    # write-then-rename so a crash mid-write never leaves a truncated file
+    tmp = path + ".tmp"
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp, path)
+
+def round_on_chain(dkg, round_id):
+    # True if DKGRegistry has round_id registered (non-zero timestamp)
+    try:
+        return dkg.functions.getRoundInfo(round_id).call()[4] != 0
+    except Exception:
+        return False
+
+def resume_round(state, chain_last, dkg):
+    """
+    Round to resume after, given Chain B's lastRound and its DKGRegistry.
+    A restored state's last_seen wins even below chain_last: registerRound is
+    mined before any postCipher, so after a crash mid-round Chain B's lastRound
+    is already that round while its ciphers are not all posted. A saved value
+    above chain_last is only used if Chain B really has that round (a reset
+    chain reusing the same addresses doesn't).
+    """
+    if not state["restored"]:
+        return chain_last
+    saved = state["last_seen"]
+    if saved > chain_last and not round_on_chain(dkg, saved):
+        return chain_last
+    return saved
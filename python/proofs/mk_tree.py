@@ -10,13 +10,13 @@ class MerkleTree:
         self.build()
 
     def build(self):
+        # one level at a time; hashlib (OpenSSL) picks SHA-NI/ARMv8 where available
+        h = hashlib.sha256
         cur = self.leaves
         while len(cur) > 1:
-            nxt = []
-            for i in range(0, len(cur), 2):
-                left = cur[i]
-                right = cur[i+1] if i+1 < len(cur) else left
-                nxt.append(sha256(left + right))
+            # odd count: last node is paired with itself (not stored in levels)
+            pad = cur + [cur[-1]] if len(cur) % 2 else cur
+            nxt = [h(left + right).digest() for left, right in zip(pad[::2], pad[1::2])]
             self.levels.append(nxt)
             cur = nxt
 
@@ -1,12 +1,14 @@
-﻿import json
-from web3 import Web3
-w3 = Web3(Web3.HTTPProvider('http://127.0.0.1:8545'))
-with open('python/abi/DKGRegistry.json','r',encoding='utf-8') as f:
-    art = json.load(f)
-abi = art.get('abi', art)
-dkg = w3.eth.contract(address=w3.to_checksum_address('0x5FbDB2315678afecb367f032d93F642f64180aa3'), abi=abi)
+﻿import requests
+# raw eth_getStorageAt: no web3 import / ABI parse / EVM call for one uint256.
+# DKGRegistry storage layout: slot 0 = rounds mapping, slot 1 = lastRound
+LAST_ROUND_SLOT = '0x1'
+RPC = 'http://127.0.0.1:8545'
+DKG_ADDR = '0x5FbDB2315678afecb367f032d93F642f64180aa3'
+payload = {'jsonrpc': '2.0', 'id': 1, 'method': 'eth_getStorageAt',
+           'params': [DKG_ADDR, LAST_ROUND_SLOT, 'latest']}
 try:
-    last = dkg.functions.lastRound().call()
+    resp = requests.post(RPC, json=payload, timeout=10).json()
+    last = int(resp['result'], 16)
 except Exception:
     last = 0
 print(last + 1)
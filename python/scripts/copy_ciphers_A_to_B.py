@@ -1,6 +1,11 @@
 # copy_ciphers_A_to_B.py
-import os, time, json
-from web3 import Web3
+import os, sys, asyncio
+from web3 import AsyncWeb3, AsyncHTTPProvider
+from eth_account import Account
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.abi_loader import load_abi
+from chain_bridge._compat import raw_tx
+from utils.fees import async_fees
 
 RPC_A = os.environ.get('RPC_A','http://127.0.0.1:8545')
 RPC_B = os.environ.get('RPC_B','http://127.0.0.1:8546')
@@ -11,45 +16,51 @@ PK = os.environ.get('PRIVATE_KEY')
 if not PK:
     raise SystemExit("Set PRIVATE_KEY in env before running.")
 
-A = Web3(Web3.HTTPProvider(RPC_A))
-B = Web3(Web3.HTTPProvider(RPC_B))
-abi = json.load(open('python/abi/CipherStore.json','r',encoding='utf-8'))['abi']
-cA = A.eth.contract(address=A.to_checksum_address(CIPHER_A), abi=abi)
-cB = B.eth.contract(address=B.to_checksum_address(CIPHER_B), abi=abi)
-
-ciphers = cA.functions.getCiphers(ROUND).call()
-print('Found', len(ciphers), 'ciphers on Chain A for round', ROUND)
-
-import time
-# ... (existing imports and setup)
-
-acct = B.eth.account.from_key(PK)
-sender = acct.address
-nonce = B.eth.get_transaction_count(sender)
-gasprice = B.eth.gas_price
-chainid = B.eth.chain_id
-
-for idx, entry in enumerate(ciphers):
-    poster, rid, cid, root, ts = entry
-    print('Posting', idx, 'cid=', cid, 'root=', root, 'rid=', rid)
-    tx = cB.functions.postCipher(rid, cid, root).build_transaction({
-        'from': sender,
-        'nonce': nonce,
-        'gas': 300000,
-        'gasPrice': gasprice,
-        'chainId': chainid
-    })
-    signed = acct.sign_transaction(tx)
-    # robust lookup for raw transaction bytes (v6 vs v5)
-    raw = getattr(signed, "raw_transaction", None) or getattr(signed, "rawTransaction", None)
-    if raw is None:
-        raise RuntimeError("Couldn't find raw transaction bytes on SignedTransaction object")
-    txh = B.eth.send_raw_transaction(raw)
-    print('submitted tx', txh.hex())
-    r = B.eth.wait_for_transaction_receipt(txh, timeout=120)
-    print('receipt status', r.status, 'logs', len(r.logs))
-    nonce += 1
-    time.sleep(0.3)
-
-
-print('Done.')
+
+async def main():
+    # one provider (and pooled aiohttp session) per chain for the whole run
+    A = AsyncWeb3(AsyncHTTPProvider(RPC_A))
+    B = AsyncWeb3(AsyncHTTPProvider(RPC_B))
+    abi = load_abi('python/abi/CipherStore.json')
+    cA = A.eth.contract(address=A.to_checksum_address(CIPHER_A), abi=abi)
+    cB = B.eth.contract(address=B.to_checksum_address(CIPHER_B), abi=abi)
+
+    ciphers = await cA.functions.getCiphers(ROUND).call()
+    print('Found', len(ciphers), 'ciphers on Chain A for round', ROUND)
+
+    acct = Account.from_key(PK)
+    sender = acct.address
+    nonce, fee_fields, chainid = await asyncio.gather(
+        B.eth.get_transaction_count(sender), async_fees(B), B.eth.chain_id)
+
+    # submit everything first with pre-incremented nonces (in nonce order) ...
+    hashes = []
+    for idx, entry in enumerate(ciphers):
+        poster, rid, cid, root, ts = entry
+        print('Posting', idx, 'cid=', cid, 'root=', root, 'rid=', rid)
+        tx = await cB.functions.postCipher(rid, cid, root).build_transaction({
+            'from': sender,
+            'nonce': nonce,
+            'gas': 300000,
+            'chainId': chainid,
+            **fee_fields
+        })
+        signed = acct.sign_transaction(tx)
+        txh = await B.eth.send_raw_transaction(raw_tx(signed))
+        print('submitted tx', txh.hex())
+        hashes.append(txh)
+        nonce += 1
+
+    # ... then wait for all receipts together, so inclusion costs ~one block
+    async def wait_receipt(txh):
+        return await B.eth.wait_for_transaction_receipt(txh, timeout=120, poll_latency=0.2)
+
+    receipts = await asyncio.gather(*[wait_receipt(h) for h in hashes])
+    for txh, r in zip(hashes, receipts):
+        print('receipt', txh.hex(), 'status', r.status, 'logs', len(r.logs))
+
+    print('Done.')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
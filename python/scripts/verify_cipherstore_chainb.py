@@ -1,9 +1,9 @@
-﻿import json
+﻿import os, sys
 from web3 import Web3
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.abi_loader import load_abi
 w3 = Web3(Web3.HTTPProvider("http://127.0.0.1:8546"))
-with open("python/abi/CipherStore.json","r",encoding="utf-8") as f:
-    art = json.load(f)
-abi = art.get("abi", art)
+abi = load_abi("python/abi/CipherStore.json")
 cs_addr = "0x71C95911E9a5D330f4D621842EC243EE1343292e"
 contract = w3.eth.contract(address=w3.to_checksum_address(cs_addr), abi=abi)
 ciphers = contract.functions.getCiphers(1).call()
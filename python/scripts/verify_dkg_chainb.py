@@ -1,9 +1,9 @@
-﻿import json
+﻿import os, sys
 from web3 import Web3
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.abi_loader import load_abi
 w3 = Web3(Web3.HTTPProvider("http://127.0.0.1:8546"))
-with open("python/abi/DKGRegistry.json","r",encoding="utf-8") as f:
-    art = json.load(f)
-abi = art.get("abi", art)
+abi = load_abi("python/abi/DKGRegistry.json")
 dkg_b = "0x8464135c8F25Da09e49BC8782676a84730C318bC"
 c = w3.eth.contract(address=w3.to_checksum_address(dkg_b), abi=abi)
 info = c.functions.getRoundInfo(1).call()
@@ -20,6 +20,11 @@ import time
 import sys
 from web3 import Web3
 
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from utils.abi_loader import load_abi
+from chain_bridge._compat import raw_tx
+from utils.fees import fees
+
 # helpers for compatibility
 def is_connected(w3):
     return getattr(w3, 'is_connected', None) and w3.is_connected() or getattr(w3, 'isConnected', None) and w3.isConnected()
@@ -69,9 +74,7 @@ abi_path = os.path.join(os.path.dirname(__file__), '..', 'abi', 'DKGRegistry.jso
 if not os.path.exists(abi_path):
     abi_path = os.path.join(os.getcwd(), 'python', 'abi', 'DKGRegistry.json')
 
-with open(abi_path, 'r', encoding='utf-8') as f:
-    art = json.load(f)
-abi = art.get('abi', art)
+abi = load_abi(abi_path)
 
 dkg_address = to_checksum(w3, DKG_ADDR)
 contract = w3.eth.contract(address=dkg_address, abi=abi)
@@ -81,22 +84,25 @@ print('Prepared contract at', dkg_address)
 # build demo ciphers and merkle root using provided local helper if available
 # For compatibility we attempt to import the project's utilities; if not available we fallback to demo values
 try:
-    from tapfed_core.model import SimpleModel
     from tapfed_core.enc import ec_encrypt_scalar, ec_add_ciphertexts
     from proofs.mk_tree import MerkleTree
     from utils.ipfs_client import upload_json
-    # create demo participants (small deterministic demo)
-    parts = []
-    for i in range(3):
-        m = SimpleModel()
-        m.fc2.bias.data.fill_(0.1 * (i+1))
-        parts.append(m)
+    # create demo participants (small deterministic demo); torch only with USE_TORCH
+    if os.getenv('USE_TORCH'):
+        from tapfed_core.model import SimpleModel
+        parts = []
+        for i in range(3):
+            m = SimpleModel()
+            m.fc2.bias.data.fill_(0.1 * (i+1))
+            parts.append(m)
+        vals = [float(p.fc2.bias.data[0].item()) for p in parts]
+    else:
+        vals = [0.1 * (i+1) for i in range(3)]
 
     cids = []
     enc_objs = []
     ciphers_bytes = []
-    for i, p in enumerate(parts):
-        val = float(p.fc2.bias.data[0].item())
+    for i, val in enumerate(vals):
         enc = ec_encrypt_scalar(None, val)
         obj = {'participant': i, 'enc': enc}
         cid = upload_json(obj)
@@ -138,8 +144,7 @@ try:
             tx = fn.build_transaction({
                 'from': sender,
                 'nonce': nonce,
-                'maxPriorityFeePerGas': w3.to_wei('1', 'gwei'),
-                'maxFeePerGas': w3.to_wei('200', 'gwei'),
+                **fees(w3),
             })
         except Exception:
             try:
@@ -153,9 +158,8 @@ try:
                 raise
 
         # sign and send
-        signed = w3.eth.account.sign_transaction(tx, private_key=PRIVATE_KEY)
-        raw = signed.rawTransaction if hasattr(signed, 'rawTransaction') else signed.raw_transaction
-        txh = w3.eth.send_raw_transaction(raw)
+        signed = acct.sign_transaction(tx)
+        txh = w3.eth.send_raw_transaction(raw_tx(signed))
         print('Submitted signed tx:', txh.hex())
         r = w3.eth.wait_for_transaction_receipt(txh)
         print('Mined in block:', r.blockNumber)
@@ -0,0 +1,38 @@
+import functools
+import json
+import os
+import pickle
+
+
+def _pickle_path(path):
+    # python/abi/DKGRegistry.json -> python/abi/DKGRegistry.abi.pkl
+    return os.path.splitext(path)[0] + ".abi.pkl"
+
+
+@functools.lru_cache(maxsize=8)
+def load_abi(path):
+    """
+    Return the ABI from a hardhat artifact (or a plain ABI JSON file).
+    Parsed once per process; the parsed ABI is also pickled next to the JSON
+    and reused by later processes while it is newer than the JSON.
+    """
+    pkl = _pickle_path(path)
+    try:
+        if os.path.getmtime(pkl) >= os.path.getmtime(path):
+            with open(pkl, "rb") as f:
+                return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    with open(path, "r", encoding="utf-8") as f:
+        art = json.load(f)
+    abi = art.get("abi", art) if isinstance(art, dict) else art
+
+    try:
+        tmp = pkl + ".tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(abi, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, pkl)
+    except OSError:
+        pass
+    return abi
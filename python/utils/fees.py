@@ -0,0 +1,56 @@
+import os
+import time
+
+# EIP-1559 fee fields derived from eth_feeHistory, cached per web3 instance
+FEE_TTL = float(os.getenv("FEE_CACHE_TTL", "10"))
+PRIORITY_FEE_CAP = int(float(os.getenv("MAX_PRIORITY_FEE_GWEI", "2")) * 10**9)
+FEE_HISTORY_BLOCKS = 5
+
+_cache = {}
+
+
+def _from_history(h):
+    # reward[i][0] is the 50th-percentile tip of block i
+    rewards = [r[0] for r in (h.get("reward") or []) if r]
+    priority = int(sum(rewards) / len(rewards)) if rewards else 0
+    priority = min(priority, PRIORITY_FEE_CAP)
+    # baseFeePerGas[-1] is the next block's base fee; 2x leaves room for growth
+    return {
+        "maxPriorityFeePerGas": priority,
+        "maxFeePerGas": h["baseFeePerGas"][-1] * 2 + priority,
+    }
+
+
+def _cached(w3):
+    hit = _cache.get(id(w3))
+    if hit and time.monotonic() - hit[0] < FEE_TTL:
+        return hit[1]
+    return None
+
+
+def fees(w3):
+    """
+    Fee fields to splat into build_transaction (**fees(w3)).
+    One eth_feeHistory call per FEE_TTL seconds; falls back to legacy
+    gasPrice on nodes without fee history.
+    """
+    val = _cached(w3)
+    if val is None:
+        try:
+            val = _from_history(w3.eth.fee_history(FEE_HISTORY_BLOCKS, "latest", [50.0]))
+        except Exception:
+            val = {"gasPrice": w3.eth.gas_price}
+        _cache[id(w3)] = (time.monotonic(), val)
+    return dict(val)
+
+
+async def async_fees(w3):
+    """fees() for an AsyncWeb3 instance."""
+    val = _cached(w3)
+    if val is None:
+        try:
+            val = _from_history(await w3.eth.fee_history(FEE_HISTORY_BLOCKS, "latest", [50.0]))
+        except Exception:
+            val = {"gasPrice": await w3.eth.gas_price}
+        _cache[id(w3)] = (time.monotonic(), val)
+    return dict(val)
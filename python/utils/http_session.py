@@ -0,0 +1,17 @@
+import requests
+from requests.adapters import HTTPAdapter
+from web3 import Web3
+
+
+def make_session():
+    # one pooled keep-alive session per chain, so every JSON-RPC call
+    # after the first skips the TCP/TLS handshake
+    s = requests.Session()
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=50)
+    s.mount("http://", adapter)
+    s.mount("https://", adapter)
+    return s
+
+
+def make_provider(rpc):
+    return Web3.HTTPProvider(rpc, session=make_session(), request_kwargs={"timeout": 30})
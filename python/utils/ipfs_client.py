@@ -5,10 +5,14 @@ try:
 except:
     IPFS_AVAILABLE = False
 import json
+import threading
 from pathlib import Path
 
 LOCAL_STORE = Path('local_ipfs_store')
 LOCAL_STORE.mkdir(exist_ok=True)
+# local store picks the next obj_<n>.json by counting files; serialize that
+# so concurrent uploads (thread pool in the posters) don't reuse an index
+_local_lock = threading.Lock()
 
 def upload_json(obj):
     if IPFS_AVAILABLE:
@@ -16,10 +20,25 @@ def upload_json(obj):
         cid = c.add_json(obj)
         return cid
     else:
-        idx = len(list(LOCAL_STORE.iterdir()))
-        path = LOCAL_STORE / f'obj_{idx}.json'
-        with open(path,'w') as f:
-            json.dump(obj,f)
+        with _local_lock:
+            idx = len(list(LOCAL_STORE.iterdir()))
+            path = LOCAL_STORE / f'obj_{idx}.json'
+            with open(path,'w') as f:
+                json.dump(obj,f)
+        return str(path)
+
+def upload_json_bytes(payload):
+    # payload: JSON already encoded to bytes, stored as-is so callers can reuse
+    # the exact same bytes (e.g. as Merkle leaves) without re-serializing
+    if IPFS_AVAILABLE:
+        c = ipfshttpclient.connect(os.getenv('IPFS_ADDR','/ip4/127.0.0.1/tcp/5001'))
+        return c.add_bytes(payload)
+    else:
+        with _local_lock:
+            idx = len(list(LOCAL_STORE.iterdir()))
+            path = LOCAL_STORE / f'obj_{idx}.json'
+            with open(path,'wb') as f:
+                f.write(payload)
         return str(path)
 
 def cat(cid):
@@ -0,0 +1,109 @@
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+from eth_abi import encode
+from web3 import Web3
+from web3.providers.base import BaseProvider
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "python"))
+from chain_bridge.relayer_full import (
+    LOG_SCAN_MAX_STEP, MULTICALL3_ABI, MULTICALL3_ADDR, _abi_type, multicall_read, scan_logs,
+)
+from utils.abi_loader import load_abi
+
+DKG_ADDR = "0x" + "11" * 20
+CIPHER_ADDR = "0x" + "22" * 20
+POSTER = "0x" + "ab" * 20
+
+
+class FakeProvider(BaseProvider):
+    """Answers every eth_call with fixed return data."""
+
+    def __init__(self, result):
+        super().__init__()
+        self.result = result
+
+    def make_request(self, method, params):
+        result = self.result if method == "eth_call" else "0x1"
+        return {"jsonrpc": "2.0", "id": 1, "result": result}
+
+    def is_connected(self, show_traceback=False):
+        return True
+
+
+def contracts(w3):
+    dkg = w3.eth.contract(address=Web3.to_checksum_address(DKG_ADDR),
+                          abi=load_abi(os.path.join(ROOT, "python", "abi", "DKGRegistry.json")))
+    cs = w3.eth.contract(address=Web3.to_checksum_address(CIPHER_ADDR),
+                         abi=load_abi(os.path.join(ROOT, "python", "abi", "CipherStore.json")))
+    return dkg, cs
+
+
+def return_data(fn, value):
+    return encode([_abi_type(o) for o in fn.abi["outputs"]], [value])
+
+
+def test_multicall_read_matches_call():
+    dkg, cs = contracts(Web3())
+    calls = [dkg.functions.getRoundInfo(3), cs.functions.getCiphers(3)]
+    round_info = (POSTER, 3, b"\x01" * 32, "bafyround", 1700000000)
+    ciphers = [(POSTER, 3, "bafy0", b"\x02" * 32, 1700000001),
+               (POSTER, 3, "bafy1", b"\x03" * 32, 1700000002)]
+    raw = [return_data(calls[0], round_info), return_data(calls[1], ciphers)]
+
+    # what fn.call() returns for the same return data
+    expected = []
+    for fn, data in zip(calls, raw):
+        dkg_direct, cs_direct = contracts(Web3(FakeProvider(Web3.to_hex(data))))
+        direct = dkg_direct if fn.address == dkg.address else cs_direct
+        expected.append(getattr(direct.functions, fn.fn_name)(3).call())
+
+    aggregate = encode(["(bool,bytes)[]"], [[(True, d) for d in raw]])
+    mc = Web3(FakeProvider(Web3.to_hex(aggregate))).eth.contract(
+        address=Web3.to_checksum_address(MULTICALL3_ADDR), abi=MULTICALL3_ABI)
+    got = multicall_read(mc, calls)
+
+    assert got == expected
+    assert got[1][0][0] == Web3.to_checksum_address(POSTER)
+    assert isinstance(got[1], list)
+
+
+def log_contract(max_range=None):
+    """Fake contract whose eth.get_logs returns one log per block and rejects
+    windows wider than max_range blocks; windows asked for are recorded."""
+    windows = []
+
+    def get_logs(params):
+        lo, hi = params["fromBlock"], params["toBlock"]
+        windows.append((lo, hi))
+        if max_range is not None and hi - lo + 1 > max_range:
+            raise ValueError("query exceeds max block range")
+        return list(range(lo, hi + 1))
+
+    w3 = SimpleNamespace(eth=SimpleNamespace(get_logs=get_logs))
+    return SimpleNamespace(address=DKG_ADDR, w3=w3), windows
+
+
+def test_scan_logs_grows_window():
+    contract, windows = log_contract()
+    assert scan_logs(contract, 0, 4999, step=500) == list(range(5000))
+    sizes = [hi - lo + 1 for lo, hi in windows]
+    assert sizes[:3] == [500, 625, 781]
+    assert max(sizes) <= LOG_SCAN_MAX_STEP
+
+
+def test_scan_logs_halves_window_on_error():
+    contract, windows = log_contract(max_range=100)
+    assert scan_logs(contract, 0, 999, step=500) == list(range(1000))
+    # 500 -> 250 -> 125 fail, 62 succeeds, then the window grows 1.25x
+    assert windows[:5] == [(0, 499), (0, 249), (0, 124), (0, 61), (62, 138)]
+
+
+def test_scan_logs_raises_when_single_block_fails():
+    contract, windows = log_contract(max_range=0)
+    with pytest.raises(ValueError):
+        scan_logs(contract, 0, 10, step=4)
+    assert windows[-1] == (0, 0)
@@ -0,0 +1,69 @@
+import json
+import os
+import sys
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "python"))
+from chain_bridge.relayer_state import load_state, resume_round, save_state
+
+
+def test_missing_file(tmp_path):
+    state = load_state(str(tmp_path / "state.json"))
+    assert state["last_seen"] == 0
+
+
+def test_legacy_format_ignored(tmp_path):
+    # older files held only a {round: [cid, ...]} map and no identity
+    path = tmp_path / "state.json"
+    path.write_text(json.dumps({"3": ["a", "b"], "7": ["c"]}))
+    state = load_state(str(path), identity=[1, "0xB"])
+    assert state["last_seen"] == 0
+
+
+def test_round_trip(tmp_path):
+    path = str(tmp_path / "state.json")
+    save_state({"identity": [1, "0xB"], "last_seen": 5}, path)
+    state = load_state(path, identity=[1, "0xB"])
+    assert state["last_seen"] == 5
+    assert state["restored"]
+    assert not os.path.exists(path + ".tmp")
+
+
+def test_other_deployment_ignored(tmp_path):
+    path = str(tmp_path / "state.json")
+    save_state({"identity": [1, "0xB"], "last_seen": 5}, path)
+    state = load_state(path, identity=[2, "0xB"])
+    assert state["last_seen"] == 0
+    assert not state["restored"]
+    assert state["identity"] == [2, "0xB"]
+
+
+def fake_dkg(registered):
+    # getRoundInfo(r).call() -> (initiator, roundId, root, cid, timestamp)
+    def get_round_info(r):
+        ts = 1000 + r if r in registered else 0
+        return SimpleNamespace(call=lambda: ("0xA", r, b"", "", ts))
+    return SimpleNamespace(functions=SimpleNamespace(getRoundInfo=get_round_info))
+
+
+def test_resume_after_crash_following_register_round(tmp_path):
+    # round 5 was registered on B (lastRound == 5) but the relayer crashed
+    # before posting all its ciphers, so the saved state still says 4
+    path = str(tmp_path / "state.json")
+    save_state({"identity": [1, "0xB"], "last_seen": 4}, path)
+    state = load_state(path, identity=[1, "0xB"])
+    assert resume_round(state, 5, fake_dkg({1, 2, 3, 4, 5})) == 4
+
+
+def test_resume_without_state_uses_chain(tmp_path):
+    state = load_state(str(tmp_path / "state.json"), identity=[1, "0xB"])
+    assert resume_round(state, 5, fake_dkg({5})) == 5
+
+
+def test_resume_ignores_saved_round_missing_on_chain(tmp_path):
+    # chain B was reset (same addresses) and only has rounds 1-2 now
+    path = str(tmp_path / "state.json")
+    save_state({"identity": [1, "0xB"], "last_seen": 9}, path)
+    state = load_state(path, identity=[1, "0xB"])
+    assert resume_round(state, 2, fake_dkg({1, 2})) == 2
+    assert resume_round(state, 2, fake_dkg({1, 2, 9})) == 9